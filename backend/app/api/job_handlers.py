@@ -41,7 +41,7 @@ from ..modules.resumes.storage import (
     save_upload_file,
     validate_resume_upload,
 )
-from ..services.progress_tracker import create_task, get_task, public_view, update_task
+from ..services.progress_tracker import create_task, get_task, public_view, purge_expired_tasks_if_due, update_task
 from ..utils.dependencies import get_current_user
 from ..utils.roles import candidate_only, recruiter_only
 
@@ -224,6 +224,7 @@ async def scan_resume_async(
         content_type=file.content_type,
         size_bytes=int(size),
     )
+    background_tasks.add_task(purge_expired_tasks_if_due)
 
     return {"success": True, "task_id": task_id}
 
@@ -35,6 +35,13 @@ UPLOAD_DIR = os.getenv("UPLOAD_DIR") or (Path(__file__).resolve().parent.parent
 # Auth / JWT
 # NOTE: keep a default for local dev so the server can boot even if SECRET_KEY isn't set.
 SECRET_KEY = os.getenv("SECRET_KEY", "dev_secret_change_me")
+# bcrypt work factor for new hashes (library default 12). Test / dev runs can lower it
+# (minimum 4) to avoid paying ~200ms per signup; existing hashes keep their own cost.
+BCRYPT_ROUNDS = max(4, min(31, int(os.getenv("BCRYPT_ROUNDS", "12") or "12")))
+# Remember successful bcrypt checks for a short while (useful for tests / burst logins).
+# Off by default; failed checks are never cached.
+AUTH_VERIFY_CACHE = (os.getenv("AUTH_VERIFY_CACHE", "0") or "0").strip() in {"1", "true", "True", "yes", "YES"}
+AUTH_VERIFY_CACHE_TTL_S = float(os.getenv("AUTH_VERIFY_CACHE_TTL_S", "300") or "300")
 
 # -------------------- Module 9: Embeddings (local) --------------------
 EMBEDDINGS_ENABLED = (os.getenv("EMBEDDINGS_ENABLED", "1") or "1").strip() in {"1", "true", "True", "yes", "YES"}
@@ -1,9 +1,10 @@
+import json
 import logging
 import os
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
@@ -11,8 +12,10 @@ from .api import auth as auth_api
 from .api import job_router as job_api
 from .api import recruiter as recruiter_api
 from .database import create_database_tables, engine
-from .utils.error_handlers import get_error_message
+from .utils.error_handlers import DATABASE_ERROR_MESSAGE, SERVER_ERROR_MESSAGE, get_error_message
 from .services.application_service import backfill_missing_application_scores
+from .services.embedding_service import warm_embedder
+from .services.progress_tracker import purge_expired_tasks_if_due
 
 app = FastAPI(title="HireEZ")
 
@@ -23,6 +26,16 @@ app.include_router(recruiter_api.router)
 logger = logging.getLogger(__name__)
 
 
+def _error_body(message: str) -> bytes:
+    # Same bytes JSONResponse would render for {"success": False, "error": message}.
+    return json.dumps({"success": False, "error": message}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Fixed error bodies are serialized once instead of on every failing request.
+_DATABASE_ERROR_BODY = _error_body(DATABASE_ERROR_MESSAGE)
+_SERVER_ERROR_BODY = _error_body(SERVER_ERROR_MESSAGE)
+
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTPException with user-friendly messages."""
@@ -46,7 +59,7 @@ async def sqlalchemy_operational_error_handler(request: Request, exc: Operationa
         status_code=503,
         content={
             "success": False,
-            "error": get_error_message("database_error"),
+            "error": DATABASE_ERROR_MESSAGE,
             "details": f"Database operation failed. Check DATABASE_URL / DB server. Details: {root_msg}",
         },
     )
@@ -56,26 +69,14 @@ async def sqlalchemy_operational_error_handler(request: Request, exc: Operationa
 async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
     """Handle general database errors."""
     logger.exception("Database SQLAlchemyError: %s", exc)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "success": False,
-            "error": get_error_message("database_error"),
-        },
-    )
+    return Response(content=_DATABASE_ERROR_BODY, status_code=500, media_type="application/json")
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle unexpected errors globally."""
     logger.exception("Unhandled exception: %s", exc)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "success": False,
-            "error": get_error_message("server_error"),
-        },
-    )
+    return Response(content=_SERVER_ERROR_BODY, status_code=500, media_type="application/json")
 
 
 @app.exception_handler(ValueError)
@@ -137,6 +138,16 @@ def on_startup() -> None:
     except Exception as e:
         logger.exception("Database initialization failed")
         app.state.db_init_error = str(e)
+        return
+
+    # Clear any expired-task backlog once at boot rather than on the first scan request.
+    purge_expired_tasks_if_due()
+
+
+@app.on_event("startup")
+def warm_embedding_model() -> None:
+    """Load the embedding model at boot instead of on the first scan request."""
+    warm_embedder()
 
 
 @app.get("/db/health")
@@ -13,12 +13,12 @@ class Embedding(Base):
     model = Column(String(120), nullable=False)
     dim = Column(Integer, nullable=False, default=0)
     text_hash = Column(String(64), nullable=False)
-    vector_json = Column(Text, nullable=False)  # JSON array of floats
+    vector_json = Column(Text, nullable=False)  # base64 float32 ("f32:" prefix) or legacy JSON array
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     __table_args__ = (
         UniqueConstraint("entity_type", "entity_id", "model", "text_hash", name="uq_embeddings_entity_model_hash"),
-        Index("ix_embeddings_lookup", "entity_type", "entity_id", "model"),
+        Index("ix_embeddings_lookup_recent", "entity_type", "entity_id", "model", "updated_at"),
     )
 
@@ -3,6 +3,17 @@ import re
 from typing import Any
 
 
+_PARENTHETICAL_RE = re.compile(r"\([^)]*\)")
+_NON_SKILL_CHARS_RE = re.compile(r"[^a-z0-9+#. ]+")
+_NON_COMPACT_CHARS_RE = re.compile(r"[^a-z0-9+#.]+")
+# ASCII fast path for _NON_SKILL_CHARS_RE: map every disallowed code point to a space.
+_NON_SKILL_CHARS_TABLE = {
+    cp: " " for cp in range(128) if chr(cp) not in "abcdefghijklmnopqrstuvwxyz0123456789+#. "
+}
+_WHITESPACE_RE = re.compile(r"\s+")
+# Output shape of normalize_skill: allowed characters in single-space separated words.
+_NORMALIZED_SKILL_RE = re.compile(r"[a-z0-9+#.]+(?: [a-z0-9+#.]+)*")
+
 SKILL_ALIASES = {
     "api": "api",
     "apis": "api",
@@ -65,21 +76,31 @@ SKILL_ALIASES = {
 
 def normalize_skill(skill: str | None) -> str:
     value = (skill or "").strip().lower()
-    value = re.sub(r"\([^)]*\)", "", value)
-    value = re.sub(r"[^a-z0-9+#. ]+", " ", value).strip()
-    return re.sub(r"\s{2,}", " ", value)
+    if _NORMALIZED_SKILL_RE.fullmatch(value):
+        # Already normalized (e.g. parser output or a canonical alias); nothing to strip.
+        return value
+    value = _PARENTHETICAL_RE.sub("", value)
+    if value.isascii():
+        value = value.translate(_NON_SKILL_CHARS_TABLE)
+    else:
+        value = _NON_SKILL_CHARS_RE.sub(" ", value)
+    return " ".join(value.split())
 
 
 def canonical_skill(skill: str | None) -> str:
     normalized = normalize_skill(skill)
-    compact = re.sub(r"[^a-z0-9+#.]+", "", normalized)
-    return SKILL_ALIASES.get(compact, SKILL_ALIASES.get(normalized, normalized))
+    # normalize_skill leaves only [a-z0-9+#. ], so dropping spaces yields the compact form.
+    compact = normalized.replace(" ", "")
+    hit = SKILL_ALIASES.get(compact)
+    if hit is None and compact != normalized:
+        hit = SKILL_ALIASES.get(normalized)
+    return normalized if hit is None else hit
 
 
 def skill_aliases(skill: str | None) -> set[str]:
     normalized = normalize_skill(skill)
     canonical = canonical_skill(skill)
-    compact = re.sub(r"[^a-z0-9+#.]+", "", normalized)
+    compact = normalized.replace(" ", "")
     aliases = {normalized, compact, canonical}
     aliases.update(
         alias for alias, target in SKILL_ALIASES.items() if target == canonical
@@ -87,9 +108,12 @@ def skill_aliases(skill: str | None) -> set[str]:
     return {alias for alias in aliases if alias}
 
 
-def contains_skill(text: str | None, skill: str | None) -> bool:
+def _prepare_haystack(text: str | None) -> tuple[str, str]:
     haystack = (text or "").lower()
-    compact_haystack = re.sub(r"[^a-z0-9+#.]+", "", haystack)
+    return haystack, _NON_COMPACT_CHARS_RE.sub("", haystack)
+
+
+def _haystack_has_skill(haystack: str, compact_haystack: str, skill: str | None) -> bool:
     for alias in skill_aliases(skill):
         if " " in alias or "-" in alias or "." in alias or "+" in alias or "#" in alias:
             pattern = re.escape(alias).replace("\\ ", r"\s+").replace("\\-", r"[-\s]?")
@@ -100,11 +124,23 @@ def contains_skill(text: str | None, skill: str | None) -> bool:
     return False
 
 
+def contains_skill(text: str | None, skill: str | None) -> bool:
+    haystack, compact_haystack = _prepare_haystack(text)
+    return _haystack_has_skill(haystack, compact_haystack, skill)
+
+
+def contains_any_skill(text: str | None, skills: list[str] | None) -> bool:
+    if not skills:
+        return False
+    haystack, compact_haystack = _prepare_haystack(text)
+    return any(_haystack_has_skill(haystack, compact_haystack, skill) for skill in skills)
+
+
 def deduplicate_skills(skills: list[str] | None) -> list[str]:
     result: list[str] = []
     seen: set[str] = set()
     for skill in skills or []:
-        label = re.sub(r"\s+", " ", str(skill or "")).strip()
+        label = _WHITESPACE_RE.sub(" ", str(skill or "")).strip()
         key = canonical_skill(label)
         if not label or key in seen:
             continue
@@ -130,8 +166,10 @@ def normalize_required_skills(raw: str | list[str] | None) -> list[str]:
 def classify_required_skills(*, text: str, required_skills: list[str] | None) -> dict[str, list[str]]:
     matched: list[str] = []
     missing: list[str] = []
+    # Lowercase and compact the text once rather than once per required skill.
+    haystack, compact_haystack = _prepare_haystack(text)
     for skill in deduplicate_skills(required_skills):
-        if contains_skill(text, skill):
+        if _haystack_has_skill(haystack, compact_haystack, skill):
             matched.append(skill)
         else:
             missing.append(skill)
@@ -50,6 +50,14 @@ def safe_unlink(path: Path | str | None) -> None:
 
 
 async def save_upload_file(file: UploadFile, dest: Path, *, max_bytes: int) -> int:
+    # Starlette records the spooled size; reject oversized uploads before touching disk.
+    if file.size is not None and file.size > max_bytes:
+        try:
+            await file.close()
+        except Exception:
+            pass
+        raise HTTPException(status_code=413, detail="File too large (max 5MB)")
+
     dest.parent.mkdir(parents=True, exist_ok=True)
     size = 0
     try:
@@ -12,6 +12,9 @@ logger = logging.getLogger(__name__)
 
 _MODEL_CACHE: dict[tuple[str, str], str] = {}
 
+# Lower-cased generation method names accepted during model discovery.
+_GENERATE_METHODS = frozenset({"generatecontent", "streamgeneratecontent"})
+
 
 class AIClientError(RuntimeError):
     """Base error for AI client failures."""
@@ -117,10 +120,10 @@ def _pick_best_model(models: list[dict[str, Any]]) -> str | None:
     """
     def supports_generate(m: dict[str, Any]) -> bool:
         methods = m.get("supportedGenerationMethods") or m.get("supported_generation_methods") or []
-        return any(str(x).lower().endswith("generatecontent") or str(x) == "generateContent" for x in methods) or (
+        if not methods:
             # Some responses omit methods; assume generateContent is supported.
-            not methods
-        )
+            return True
+        return any(str(x).lower().rsplit("/", 1)[-1] in _GENERATE_METHODS for x in methods)
 
     candidates = [m for m in models if isinstance(m, dict) and supports_generate(m)]
     if not candidates:
@@ -137,7 +140,8 @@ def _pick_best_model(models: list[dict[str, Any]]) -> str | None:
         is_stable = 0 if "preview" in name or "2.5" in name or "pro" in name else 1
         return (is_stable, is_20, is_lite, is_flash)
 
-    best = sorted(candidates, key=score, reverse=True)[0]
+    # max() keeps the first candidate on ties, matching the previous stable sort.
+    best = max(candidates, key=score)
     name = best.get("name")
     return str(name) if name else None
 
@@ -8,6 +8,9 @@ _FENCED_JSON_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```", re.IGNORECASE)
 
 def _clean_model_json_text(text: str) -> str:
     raw = (text or "").strip()
+    if "```" not in raw:
+        # Common case: the model honoured the JSON mime type and sent no fence.
+        return raw
     fenced = _FENCED_JSON_RE.search(raw)
     if fenced:
         raw = fenced.group(1).strip()
@@ -24,6 +24,32 @@ _AI_EXPLANATION_FALLBACK_MESSAGE = "AI explanation could not be generated. The m
 _TRANSIENT_AI_STATUS_CODES = {408, 429, 500, 502, 503, 504}
 _MODEL_UNAVAILABLE_STATUS_CODES = {404}
 
+_ANALYSIS_SYSTEM_PROMPT = "You are an evidence-based recruiting assistant. Return valid JSON only."
+# Static instructions are kept as one constant prefix so every request sends
+# byte-identical leading text; only the JSON payload appended after it varies.
+_ANALYSIS_PROMPT_PREFIX = (
+    "Analyze the supplied factual candidate data against the job. Do not calculate or output a numeric score. "
+    "Use only evidence from the candidate data, matched skills, missing skills, and job description. "
+    "Do not invent candidate experience, impact, education, or weaknesses. "
+    "Return only JSON with this exact shape: "
+    '{"candidate_summary":string,"strengths":string[],"weaknesses":string[],'
+    '"strength_reasoning":string,"weakness_reasoning":string,'
+    '"matched_skills":string[],"missing_skills":string[],"recommendation":string,"reasoning":string}. '
+    "The recommendation must be exactly one of: Strong Fit, Good Fit, Average Fit, Review Manually, Weak Fit. "
+    "candidate_summary rules: maximum 2 concise lines and factual only. Do not include recommendations, hiring decisions, "
+    "strengths, weaknesses, or suitability. Summarize only the candidate background: primary profile "
+    "(for example Full-Stack Developer, AI/ML Engineer, Backend Developer), major project names, primary technology stack, "
+    "education including college/university name and CGPA/percentage if present, and professional experience including company "
+    "names, job titles, and measurable impact/contributions if present. Omit missing facts; do not invent them. "
+    "Do not repeat information shown elsewhere or list the whole resume. "
+    "strengths rules: short evidence chips only, not paragraphs; include only demonstrated strengths relevant to the job. "
+    "weaknesses rules: short chips only; include only genuine missing or weak areas from required job skills/experience; "
+    "do not invent weaknesses if the resume demonstrates the requirement. "
+    "strength_reasoning rules: max 2 short paragraphs, each around 2-3 lines, explaining project/experience evidence, matched skills, system impact, and job alignment. "
+    "weakness_reasoning rules: max 2 short paragraphs, each around 2-3 lines, explaining only genuine missing or unclear requirements, severity, and what to verify in interview; if no meaningful gaps exist, say that briefly. "
+    "reasoning rules: max 2 short paragraphs, each around 2-3 lines, connecting the candidate's projects, skills, experience/education, and overall fit without repeating candidate_summary verbatim.\n\n"
+)
+
 
 def _model_candidates() -> list[str]:
     seen: set[str] = set()
@@ -84,29 +110,7 @@ async def analyze_resume_for_job(
         "matched_skills": matched_skills,
         "missing_skills": missing_skills,
     }
-    prompt = (
-        "Analyze the supplied factual candidate data against the job. Do not calculate or output a numeric score. "
-        "Use only evidence from the candidate data, matched skills, missing skills, and job description. "
-        "Do not invent candidate experience, impact, education, or weaknesses. "
-        "Return only JSON with this exact shape: "
-        '{"candidate_summary":string,"strengths":string[],"weaknesses":string[],'
-        '"strength_reasoning":string,"weakness_reasoning":string,'
-        '"matched_skills":string[],"missing_skills":string[],"recommendation":string,"reasoning":string}. '
-        "The recommendation must be exactly one of: Strong Fit, Good Fit, Average Fit, Review Manually, Weak Fit. "
-        "candidate_summary rules: maximum 2 concise lines and factual only. Do not include recommendations, hiring decisions, "
-        "strengths, weaknesses, or suitability. Summarize only the candidate background: primary profile "
-        "(for example Full-Stack Developer, AI/ML Engineer, Backend Developer), major project names, primary technology stack, "
-        "education including college/university name and CGPA/percentage if present, and professional experience including company "
-        "names, job titles, and measurable impact/contributions if present. Omit missing facts; do not invent them. "
-        "Do not repeat information shown elsewhere or list the whole resume. "
-        "strengths rules: short evidence chips only, not paragraphs; include only demonstrated strengths relevant to the job. "
-        "weaknesses rules: short chips only; include only genuine missing or weak areas from required job skills/experience; "
-        "do not invent weaknesses if the resume demonstrates the requirement. "
-        "strength_reasoning rules: max 2 short paragraphs, each around 2-3 lines, explaining project/experience evidence, matched skills, system impact, and job alignment. "
-        "weakness_reasoning rules: max 2 short paragraphs, each around 2-3 lines, explaining only genuine missing or unclear requirements, severity, and what to verify in interview; if no meaningful gaps exist, say that briefly. "
-        "reasoning rules: max 2 short paragraphs, each around 2-3 lines, connecting the candidate's projects, skills, experience/education, and overall fit without repeating candidate_summary verbatim.\n\n"
-        + json.dumps(compact_input, ensure_ascii=False)
-    )
+    prompt = _ANALYSIS_PROMPT_PREFIX + json.dumps(compact_input, ensure_ascii=False)
     meta: dict[str, Any] = {"status": "success", "model": GEMINI_MODEL, "generated_at": datetime.now(timezone.utc).isoformat()}
     last_error: Exception | None = None
     for index, model in enumerate(_model_candidates()):
@@ -117,7 +121,7 @@ async def analyze_resume_for_job(
                 api_version=GEMINI_API_VERSION,
                 model=model,
                 user_text=prompt,
-                system_text="You are an evidence-based recruiting assistant. Return valid JSON only.",
+                system_text=_ANALYSIS_SYSTEM_PROMPT,
                 response_mime_type="application/json",
                 temperature=0.0,
                 timeout_s=AI_TIMEOUT_S,
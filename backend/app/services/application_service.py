@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 
 from ..modules.matching.skills import (
     classify_required_skills,
-    contains_skill,
+    contains_any_skill,
     normalize_required_skills,
 )
 from ..models.ai_resume_analysis import AIResumeAnalysis
@@ -137,7 +137,7 @@ def analysis_conflicts_with_skill_snapshot(analysis: dict[str, Any], matched_ski
         else:
             text_parts.append(str(value or ""))
     text = " ".join(text_parts)
-    return any(contains_skill(text, skill) for skill in matched_skills or [])
+    return contains_any_skill(text, matched_skills)
 
 
 def factual_candidate_summary_from_resume(resume: Any | None) -> str:
@@ -9,13 +9,16 @@ This module is responsible for:
 - exposing lightweight diagnostics for downstream semantic matching
 """
 
+import base64
 import hashlib
 import json
 import logging
 import os
 import re
+import threading
 from typing import Any
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from ..config import EMBEDDINGS_ENABLED, EMBEDDINGS_MODEL, EMBEDDINGS_PROVIDER
@@ -27,7 +30,11 @@ logger = logging.getLogger(__name__)
 _WS_RE = re.compile(r"\s+")
 _EMBEDDER = None
 _EMBEDDER_FAILED = False
+_EMBEDDER_LOCK = threading.Lock()
 _MAX_EMBED_TEXT_CHARS = 12000
+# Stored vectors are little-endian float32 bytes, base64 encoded behind this
+# prefix. Rows without it are legacy JSON arrays.
+_VECTOR_F32_PREFIX = "f32:"
 
 
 def normalize_text(text: str) -> str:
@@ -53,8 +60,41 @@ def text_hash(*, text: str, model: str) -> str:
     """
     Compute a stable content hash for an embedding input.
     """
-    blob = f"{model}\n{text}".encode("utf-8", errors="ignore")
-    return hashlib.sha256(blob).hexdigest()
+    h = hashlib.sha256(model.encode("utf-8", errors="ignore"))
+    h.update(b"\n")
+    h.update(text.encode("utf-8", errors="ignore"))
+    return h.hexdigest()
+
+
+def encode_vector(vector: list[float]) -> str:
+    """
+    Serialize an embedding vector into the compact text form stored in `vector_json`.
+    """
+    raw = np.asarray(vector, dtype="<f4").tobytes()
+    return _VECTOR_F32_PREFIX + base64.b64encode(raw).decode("ascii")
+
+
+def vector_from_row(row: Embedding | None) -> list[float]:
+    """
+    Decode the stored vector of an embedding row.
+
+    Reads both the compact float32 encoding and legacy JSON arrays; returns an
+    empty list for missing or unreadable payloads.
+    """
+    payload = getattr(row, "vector_json", None) or ""
+    if payload.startswith(_VECTOR_F32_PREFIX):
+        try:
+            raw = base64.b64decode(payload[len(_VECTOR_F32_PREFIX):])
+            return np.frombuffer(raw, dtype="<f4").tolist()
+        except ValueError:
+            return []
+    try:
+        data = json.loads(payload)
+    except (TypeError, ValueError):
+        return []
+    if not isinstance(data, list):
+        return []
+    return [float(x) for x in data]
 
 
 def _get_embedder():
@@ -67,27 +107,48 @@ def _get_embedder():
     global _EMBEDDER, _EMBEDDER_FAILED
     if _EMBEDDER is not None:
         return _EMBEDDER
-    if _EMBEDDER_FAILED:
-        raise RuntimeError("Local embedding model is unavailable.")
-    if EMBEDDINGS_PROVIDER != "local":
-        raise RuntimeError("Only local embeddings are supported in this build.")
-    for key in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy"):
-        os.environ.pop(key, None)
-    try:
-        from sentence_transformers import SentenceTransformer  # type: ignore
-    except Exception as e:
-        _EMBEDDER_FAILED = True
-        raise RuntimeError(
-            "sentence-transformers is not installed. Install backend requirements."
-        ) from e
+    with _EMBEDDER_LOCK:
+        # Re-check under the lock so concurrent first calls load the model once.
+        if _EMBEDDER is not None:
+            return _EMBEDDER
+        if _EMBEDDER_FAILED:
+            raise RuntimeError("Local embedding model is unavailable.")
+        if EMBEDDINGS_PROVIDER != "local":
+            raise RuntimeError("Only local embeddings are supported in this build.")
+        for key in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy"):
+            os.environ.pop(key, None)
+        try:
+            from sentence_transformers import SentenceTransformer  # type: ignore
+        except Exception as e:
+            _EMBEDDER_FAILED = True
+            raise RuntimeError(
+                "sentence-transformers is not installed. Install backend requirements."
+            ) from e
+        try:
+            _EMBEDDER = SentenceTransformer(EMBEDDINGS_MODEL, local_files_only=True)
+        except TypeError:
+            _EMBEDDER = SentenceTransformer(EMBEDDINGS_MODEL)
+        except Exception as e:
+            _EMBEDDER_FAILED = True
+            raise RuntimeError("Local embedding model is unavailable. Semantic score will fall back to 0.") from e
+        return _EMBEDDER
+
+
+def warm_embedder() -> bool:
+    """
+    Load the local embedding model ahead of the first request.
+
+    Returns True when the model is ready; failures are logged and left for
+    request-time fallbacks to handle.
+    """
+    if not EMBEDDINGS_ENABLED:
+        return False
     try:
-        _EMBEDDER = SentenceTransformer(EMBEDDINGS_MODEL, local_files_only=True)
-    except TypeError:
-        _EMBEDDER = SentenceTransformer(EMBEDDINGS_MODEL)
-    except Exception as e:
-        _EMBEDDER_FAILED = True
-        raise RuntimeError("Local embedding model is unavailable. Semantic score will fall back to 0.") from e
-    return _EMBEDDER
+        _get_embedder()
+    except RuntimeError as e:
+        logger.warning("Embedding model warm-up failed: %s", e)
+        return False
+    return True
 
 
 def embed_text(text: str) -> list[float]:
@@ -96,18 +157,33 @@ def embed_text(text: str) -> list[float]:
 
     Uses the Sentence Transformers stack with the configured embedding model.
     """
+    return embed_texts([text])[0]
+
+
+def embed_texts(texts: list[str]) -> list[list[float]]:
+    """
+    Generate embeddings for several texts with a single encoder call.
+
+    Empty inputs (or disabled embeddings) yield empty vectors at the same
+    positions, so results always line up with `texts`.
+    """
+    out: list[list[float]] = [[] for _ in texts]
     if not EMBEDDINGS_ENABLED:
-        return []
-    t = truncate_for_embedding(text=text)
-    if not t:
-        return []
+        return out
+    prepared = [truncate_for_embedding(text=t) for t in texts]
+    positions = [i for i, t in enumerate(prepared) if t]
+    if not positions:
+        return out
+    batch = [prepared[i] for i in positions]
     embedder = _get_embedder()
     try:
-        vec = embedder.encode(t, convert_to_numpy=True, normalize_embeddings=True)
+        vecs = embedder.encode(batch, convert_to_numpy=True, normalize_embeddings=True)
     except TypeError:
         # Some versions may not support all kwargs in the exact same way.
-        vec = embedder.encode(t)
-    return [float(x) for x in vec.tolist()]
+        vecs = embedder.encode(batch)
+    for i, vec in zip(positions, vecs):
+        out[i] = [float(x) for x in vec.tolist()]
+    return out
 
 
 def get_or_create_embedding_details(
@@ -177,7 +253,7 @@ def get_or_create_embedding_details(
         meta["failure_reason"] = "empty_vector"
         return None, meta
 
-    payload = json.dumps(vector, ensure_ascii=False)
+    payload = encode_vector(vector)
     dim = len(vector)
     meta["vector_dim"] = dim
 
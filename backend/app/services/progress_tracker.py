@@ -1,4 +1,5 @@
 import json
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -9,6 +10,9 @@ from ..models.analysis_task import AnalysisTask
 
 
 TASK_TTL_HOURS = 24
+TASK_PURGE_INTERVAL_S = 600
+
+_last_purge_at: float | None = None
 
 
 def _now() -> datetime:
@@ -48,6 +52,43 @@ def _row_to_task(row: AnalysisTask) -> dict[str, Any]:
     }
 
 
+def purge_expired_tasks() -> int:
+    """Delete finished tasks past their expiry; returns the number of rows removed."""
+    db = SessionLocal()
+    try:
+        removed = db.query(AnalysisTask).filter(
+            AnalysisTask.expires_at.isnot(None),
+            AnalysisTask.expires_at < _now(),
+            AnalysisTask.status != "running",
+        ).delete(synchronize_session=False)
+        db.commit()
+        return int(removed or 0)
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def purge_expired_tasks_if_due() -> None:
+    """
+    Best-effort, rate-limited purge of expired tasks.
+
+    Runs at startup and as a background task after scans are queued, never
+    inline on the request path.
+    """
+    global _last_purge_at
+    now = time.monotonic()
+    if _last_purge_at is not None and now - _last_purge_at < TASK_PURGE_INTERVAL_S:
+        return
+    _last_purge_at = now
+    try:
+        purge_expired_tasks()
+    except SQLAlchemyError:
+        # Cleanup is best-effort; a failed purge is retried on the next due call.
+        pass
+
+
 def create_task(*, task_id: str, user_id: int, job_id: int) -> None:
     db = SessionLocal()
     try:
@@ -72,15 +113,16 @@ def create_task(*, task_id: str, user_id: int, job_id: int) -> None:
 def update_task(*, task_id: str, percent: int | None = None, message: str | None = None) -> None:
     db = SessionLocal()
     try:
-        row = db.query(AnalysisTask).filter(AnalysisTask.id == task_id).first()
-        if not row or row.status != "running":
-            return
+        values: dict[str, Any] = {"updated_at": _now()}
         if percent is not None:
-            row.progress = max(0, min(99, int(percent)))
+            values["progress"] = max(0, min(99, int(percent)))
         if message is not None:
-            row.message = str(message)
-        row.updated_at = _now()
-        db.add(row)
+            values["message"] = str(message)
+        # Single conditional UPDATE: no read-modify-write, and finished tasks are left untouched.
+        db.query(AnalysisTask).filter(
+            AnalysisTask.id == task_id,
+            AnalysisTask.status == "running",
+        ).update(values, synchronize_session=False)
         db.commit()
     except SQLAlchemyError:
         db.rollback()
@@ -9,6 +9,7 @@ This module is responsible for:
 """
 
 import re
+from collections import Counter
 
 
 _WORD_RE = re.compile(r"[a-zA-Z0-9+#.]{2,}")
@@ -163,24 +164,16 @@ def _repeated_header_footer_lines(page_texts: list[str]) -> set[str]:
     if len(page_texts) < 2:
         return set()
 
-    def norm_line(line: str) -> str:
-        line = _normalize_newlines(line)
-        line = _strip_control_chars(line)
-        line = _normalize_punctuation_and_symbols(line)
-        line = _MULTISPACE_RE.sub(" ", line).strip()
-        return line
-
-    counts: dict[str, int] = {}
+    counts: Counter[str] = Counter()
     for p in page_texts:
-        lines = [norm_line(l) for l in _normalize_newlines(p).split("\n") if norm_line(l)]
+        # Page-level normalization is line-local, so do it once per page and
+        # only collapse spacing on the few edge lines that are counted.
+        page = _normalize_punctuation_and_symbols(_strip_control_chars(_normalize_newlines(p)))
+        lines = [l for l in page.split("\n") if l.strip()]
         if not lines:
             continue
-        head = lines[:4]
-        tail = lines[-4:] if len(lines) >= 4 else lines
-        for l in set(head + tail):
-            if len(l) < 6 or l.isdigit():
-                continue
-            counts[l] = counts.get(l, 0) + 1
+        edges = {_MULTISPACE_RE.sub(" ", l).strip() for l in lines[:4] + lines[-4:]}
+        counts.update(l for l in edges if len(l) >= 6 and not l.isdigit())
 
     return {l for (l, c) in counts.items() if c >= 2}
 
@@ -25,10 +25,41 @@ _HEADING_ALIASES: dict[str, list[str]] = {
     "achievements": ["achievements", "achievement", "awards", "honors", "accomplishments"],
 }
 
+
+def _build_heading_lookup() -> dict[str, str]:
+    """Flatten heading aliases; the first section listing an alias wins, as in an in-order scan."""
+    lookup: dict[str, str] = {}
+    for canonical, aliases in _HEADING_ALIASES.items():
+        for alias in (canonical, *aliases):
+            lookup.setdefault(alias, canonical)
+    return lookup
+
+
+_HEADING_LOOKUP = _build_heading_lookup()
+# Headings match only after punctuation/rulers are stripped, so a line can be a
+# heading only if it has no more alphanumerics than the longest alias.
+_MAX_HEADING_LINE_CHARS = 48
+_MAX_HEADING_ALNUM = max(sum(ch.isalnum() for ch in alias) for alias in _HEADING_LOOKUP)
+# Anchored match that succeeds once a line holds more alphanumerics than any
+# heading can; the two classes are disjoint, so it never backtracks.
+_TOO_MANY_ALNUM_RE = re.compile(r"(?:[\W_]*[^\W_]){%d}" % (_MAX_HEADING_ALNUM + 1))
+
 _LINE_CLEAN_RE = re.compile(r"[\t ]{2,}")
 _BULLET_LINE_RE = re.compile(r"^\s*[-•\u2022*]\s+")
 _SKILL_SPLIT_RE = re.compile(r"[,/|•\u2022;\n]+")
 _WORD_SKILL_RE = re.compile(r"[A-Za-z0-9+#.]{2,}")
+_HEADING_PUNCT_RE = re.compile(r"[^a-z0-9 &]+")
+_SKILL_PUNCT_RE = re.compile(r"[^A-Za-z0-9+#. ]+")
+# ASCII fast path for _SKILL_PUNCT_RE: map every disallowed code point to a space.
+_SKILL_PUNCT_TABLE = {
+    cp: " "
+    for cp in range(128)
+    if not (chr(cp).isalnum() or chr(cp) in "+#. ")
+}
+_VERSIONED_SKILL_RE = re.compile(r"^[A-Za-z]{1,6}\d+(\.\d+)?$")
+_SINGLE_SKILL_TOKEN_RE = re.compile(r"^[A-Za-z0-9+#.]+$")
+_WHITESPACE_RE = re.compile(r"\s+")
+_AT_SPLIT_RE = re.compile(r"\bat\b", re.IGNORECASE)
 _DATE_HINT_RE = re.compile(
     r"\b("
     r"\d{4}\s*[-–]\s*(?:\d{4}|present|current|now)"
@@ -133,24 +164,34 @@ def _normalize_line(s: str) -> str:
 
 def _canonical_heading(line: str) -> str | None:
     """Map a heading line to a canonical section key."""
+    if len(line) > _MAX_HEADING_LINE_CHARS and _TOO_MANY_ALNUM_RE.match(line):
+        # Body text: skip normalization and regex work for lines that cannot be headings.
+        # Only alphanumerics count, so padding and ruler decoration never reject a heading.
+        return None
     raw = _normalize_line(line)
     if not raw:
         return None
 
     key = raw.strip().strip(":").strip("-").strip().lower()
-    key = re.sub(r"[^a-z0-9 &]+", "", key).strip()
+    key = _HEADING_PUNCT_RE.sub("", key).strip()
     if not key:
         return None
 
-    for canonical, aliases in _HEADING_ALIASES.items():
-        if key == canonical or key in aliases:
-            return canonical
-    return None
+    return _HEADING_LOOKUP.get(key)
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split text into lines after normalizing newline sequences."""
+    return (text or "").replace("\r\n", "\n").replace("\r", "\n").split("\n")
 
 
 def detect_sections(*, text: str) -> dict[str, dict[str, Any]]:
     """Detect section spans by scanning known headings line by line."""
-    lines = (text or "").replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return _detect_sections_in_lines(_split_lines(text))
+
+
+def _detect_sections_in_lines(lines: list[str]) -> dict[str, dict[str, Any]]:
+    """Detect section spans over already-split lines."""
     hits: list[tuple[int, str, str]] = []
     for i, line in enumerate(lines):
         canon = _canonical_heading(line)
@@ -179,8 +220,8 @@ def _slice_text(lines: list[str], start: int, end: int) -> str:
 
 def extract_section_texts(*, text: str) -> dict[str, str]:
     """Extract text for the main resume sections."""
-    lines = (text or "").replace("\r\n", "\n").replace("\r", "\n").split("\n")
-    spans = detect_sections(text=text)
+    lines = _split_lines(text)
+    spans = _detect_sections_in_lines(lines)
     out: dict[str, str] = {}
     for sec in ("skills", "experience", "projects", "education", "certifications", "achievements"):
         meta = spans.get(sec)
@@ -225,8 +266,8 @@ def normalize_skills(*, items: list[str]) -> list[str]:
         s = s.strip(" -•\u2022").strip()
         if not s:
             continue
-        s = re.sub(r"[^A-Za-z0-9+#. ]+", " ", s).strip()
-        s = _LINE_CLEAN_RE.sub(" ", s)
+        s = s.translate(_SKILL_PUNCT_TABLE) if s.isascii() else _SKILL_PUNCT_RE.sub(" ", s)
+        s = " ".join(s.split())
         if len(s) < 2 or len(s) > 40:
             continue
 
@@ -235,9 +276,9 @@ def normalize_skills(*, items: list[str]) -> list[str]:
             norm = _SKILL_ALIASES[alias_key]
         elif s.isupper():
             norm = s
-        elif re.match(r"^[A-Za-z]{1,6}\d+(\.\d+)?$", s):
+        elif _VERSIONED_SKILL_RE.match(s):
             norm = s
-        elif re.match(r"^[A-Za-z0-9+#.]+$", s):
+        elif _SINGLE_SKILL_TOKEN_RE.match(s):
             norm = s
             if s.lower() in {"api", "apis", "sql", "aws", "gcp", "ml", "ai", "ci", "cd", "html", "css", "nlp"}:
                 norm = s.upper()
@@ -279,7 +320,7 @@ def _clean_structured_line(line: str) -> str:
     """Clean a raw section line before structuring it."""
     line = _normalize_line(line)
     line = _BULLET_LINE_RE.sub("", line).strip()
-    line = re.sub(r"\s+", " ", line)
+    line = _WHITESPACE_RE.sub(" ", line)
     return line
 
 
@@ -292,7 +333,7 @@ def _extract_job_title_and_company(line: str) -> tuple[str, str]:
     """Best-effort extraction of job title and company name from one experience line."""
     normalized = line.strip()
     if " at " in normalized.lower():
-        parts = re.split(r"\bat\b", normalized, maxsplit=1, flags=re.IGNORECASE)
+        parts = _AT_SPLIT_RE.split(normalized, maxsplit=1)
         if len(parts) == 2:
             return parts[0].strip(" |-,"), parts[1].strip(" |-,")
     for sep in (" | ", " - ", " — ", " @ "):
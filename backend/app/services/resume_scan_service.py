@@ -9,7 +9,7 @@ from ..models.job import Job
 from ..services.ai_service import analyze_resume_for_job
 from ..services.application_service import classify_required_skills_from_text
 from ..services.application_serializer import job_required_skills_list
-from ..services.embedding_service import embed_text
+from ..services.embedding_service import embed_texts
 from ..services.matching_pipeline import evaluate_candidate_for_job
 from ..services.progress_tracker import complete_task, fail_task, update_task
 from ..services.resume_extractor import extract_and_clean_resume_text
@@ -67,7 +67,8 @@ async def run_scan_task(
         prog(74, "Computing similarity...")
         job_text = f"{job.job_title or ''}\n{job.job_description or ''}".strip()
         try:
-            semantic_score = cosine_similarity(embed_text(extracted), embed_text(job_text))
+            resume_vec, job_vec = embed_texts([extracted, job_text])
+            semantic_score = cosine_similarity(resume_vec, job_vec)
         except Exception:
             semantic_score = 0.0
 
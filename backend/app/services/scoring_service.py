@@ -17,7 +17,7 @@ from ..modules.matching.skills import normalize_skill as _normalize_skill
 
 
 _WORD_RE = re.compile(r"[A-Za-z0-9+#.]{2,}")
-_STOP = {
+_STOP = frozenset({
     "a",
     "an",
     "and",
@@ -41,7 +41,11 @@ _STOP = {
     "with",
     "you",
     "your",
-}
+})
+
+_DEGREE_KEYWORDS = ("b.tech", "btech", "b.e", "be ", "bachelor", "m.tech", "mtech", "master", "computer science", "engineering")
+_CERT_KEYWORDS = ("certification", "certified", "course", "bootcamp", "specialization")
+_STEM_KEYWORDS = ("backend", "api", "cloud", "data", "python", "java", "javascript", "sql", "devops")
 
 SCORING_WEIGHTS = {
     "skills": 0.45,
@@ -51,12 +55,17 @@ SCORING_WEIGHTS = {
 }
 
 
+def _unit_score(value: float | None) -> float:
+    """Coerce an optional component score into [0, 1]."""
+    return max(0.0, min(1.0, float(value or 0.0)))
+
+
 def _context_tokens(text: str | None) -> list[str]:
     """Extract non-skill context terms for experience and project relevance."""
     seen: set[str] = set()
     result: list[str] = []
-    for match in _WORD_RE.finditer((text or "").lower()):
-        token = match.group(0).strip(".")
+    for raw in _WORD_RE.findall(text or ""):
+        token = raw.strip(".").lower()
         if not token or token in _STOP or token in seen:
             continue
         seen.add(token)
@@ -64,13 +73,56 @@ def _context_tokens(text: str | None) -> list[str]:
     return result
 
 
-def extract_resume_skills(*, structured_json: str | None, ai_structured_json: str | None = None) -> list[str]:
+def _load_resume_payload(structured_json: str | None, ai_structured_json: str | None) -> dict[str, Any]:
+    """Parse the preferred resume payload once; missing or malformed JSON yields an empty dict."""
+    raw = structured_json or ai_structured_json or ""
+    if not raw:
+        return {}
+    try:
+        payload: Any = json.loads(raw)
+    except (TypeError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _matched_job_tokens(text: str, job_tokens: list[str], limit: int) -> tuple[set[str], bool]:
+    """
+    Stream section tokens and collect those that are also job tokens.
+
+    Mirrors the distinct-token cap of the relevance scorers (only the first
+    `limit` distinct tokens count) and stops early once every job token has
+    matched. The flag reports whether any usable token was seen.
+    """
+    job_set = frozenset(job_tokens)
+    seen: set[str] = set()
+    matched: set[str] = set()
+    for m in _WORD_RE.finditer(text):
+        w = m.group(0).strip(".").lower()
+        if not w or w in _STOP or w in seen:
+            continue
+        seen.add(w)
+        if w in job_set:
+            matched.add(w)
+            if len(matched) == len(job_set):
+                break
+        if len(seen) >= limit:
+            break
+    return matched, bool(seen)
+
+
+def extract_resume_skills(
+    *,
+    structured_json: str | None,
+    ai_structured_json: str | None = None,
+    payload: dict[str, Any] | None = None,
+) -> list[str]:
     """
     Extract normalized skills from deterministic or AI-structured resume payloads.
 
     Args:
         structured_json: Deterministic structured resume JSON.
         ai_structured_json: AI-structured resume JSON fallback.
+        payload: Already-parsed resume payload; skips JSON decoding when given.
 
     Returns:
         A deduplicated list of canonical skill tokens and phrases.
@@ -82,14 +134,9 @@ def extract_resume_skills(*, structured_json: str | None, ai_structured_json: st
         Returns an empty list when the payload is missing, malformed, or does
         not contain a skills item list.
     """
-    raw = structured_json or ai_structured_json or ""
-    if not raw:
-        return []
-    try:
-        payload: Any = json.loads(raw)
-    except Exception:
-        return []
-    items = ((((payload or {}).get("sections") or {}).get("skills") or {}).get("items") or [])
+    if payload is None:
+        payload = _load_resume_payload(structured_json, ai_structured_json)
+    items = (((payload.get("sections") or {}).get("skills") or {}).get("items") or [])
     if not isinstance(items, list):
         return []
 
@@ -99,10 +146,7 @@ def extract_resume_skills(*, structured_json: str | None, ai_structured_json: st
         n = _canonical_skill(str(it))
         if not n:
             continue
-        candidates = [n]
-        if " " in n:
-            candidates.extend([p for p in n.split(" ") if p])
-        for c in candidates:
+        for c in ((n,) if " " not in n else (n, *n.split(" "))):
             if not c or c in seen:
                 continue
             seen.add(c)
@@ -165,13 +209,15 @@ def skills_overlap_score(*, resume_skills: list[str], job_skills: list[str]) ->
     Error Handling:
         Returns a zero score when no job skill tokens are available.
     """
-    rs = set(resume_skills or [])
     js = list(job_skills or [])
     if not js:
         return 0.0, [], []
-    matched = [j for j in js if j in rs]
-    missing = [j for j in js if j not in rs]
-    score = len(matched) / max(1, len(js))
+    rs = frozenset(resume_skills or ())
+    matched: list[str] = []
+    missing: list[str] = []
+    for j in js:
+        (matched if j in rs else missing).append(j)
+    score = len(matched) / len(js)
     return float(max(0.0, min(1.0, score))), matched[:12], missing[:8]
 
 
@@ -180,6 +226,7 @@ def extract_resume_section_text(
     section_name: str,
     structured_json: str | None,
     ai_structured_json: str | None = None,
+    payload: dict[str, Any] | None = None,
 ) -> str:
     """
     Extract a best-effort section text blob from resume payloads.
@@ -188,6 +235,7 @@ def extract_resume_section_text(
         section_name: Resume section key to extract.
         structured_json: Deterministic structured resume JSON.
         ai_structured_json: AI-structured resume JSON fallback.
+        payload: Already-parsed resume payload; skips JSON decoding when given.
 
     Returns:
         A single combined experience text string.
@@ -198,15 +246,10 @@ def extract_resume_section_text(
     Error Handling:
         Returns an empty string when parsing fails or the section is missing.
     """
-    raw = structured_json or ai_structured_json or ""
-    if not raw:
-        return ""
-    try:
-        payload: Any = json.loads(raw)
-    except (TypeError, ValueError, json.JSONDecodeError):
-        return ""
+    if payload is None:
+        payload = _load_resume_payload(structured_json, ai_structured_json)
 
-    section = (((payload or {}).get("sections") or {}).get(section_name) or {})
+    section = ((payload.get("sections") or {}).get(section_name) or {})
     txt = str(section.get("text") or "")
     items = section.get("items") or []
     if isinstance(items, list) and items:
@@ -215,13 +258,19 @@ def extract_resume_section_text(
     return txt.strip()
 
 
-def extract_resume_experience_text(*, structured_json: str | None, ai_structured_json: str | None = None) -> str:
+def extract_resume_experience_text(
+    *,
+    structured_json: str | None,
+    ai_structured_json: str | None = None,
+    payload: dict[str, Any] | None = None,
+) -> str:
     """
     Extract a best-effort experience text blob from resume payloads.
 
     Args:
         structured_json: Deterministic structured resume JSON.
         ai_structured_json: AI-structured resume JSON fallback.
+        payload: Already-parsed resume payload; skips JSON decoding when given.
 
     Returns:
         A single combined experience text string.
@@ -236,16 +285,23 @@ def extract_resume_experience_text(*, structured_json: str | None, ai_structured
         section_name="experience",
         structured_json=structured_json,
         ai_structured_json=ai_structured_json,
+        payload=payload,
     )
 
 
-def extract_resume_projects_text(*, structured_json: str | None, ai_structured_json: str | None = None) -> str:
+def extract_resume_projects_text(
+    *,
+    structured_json: str | None,
+    ai_structured_json: str | None = None,
+    payload: dict[str, Any] | None = None,
+) -> str:
     """
     Extract a best-effort projects text blob from resume payloads.
 
     Args:
         structured_json: Deterministic structured resume JSON.
         ai_structured_json: AI-structured resume JSON fallback.
+        payload: Already-parsed resume payload; skips JSON decoding when given.
 
     Returns:
         A single combined projects text string.
@@ -260,16 +316,23 @@ def extract_resume_projects_text(*, structured_json: str | None, ai_structured_j
         section_name="projects",
         structured_json=structured_json,
         ai_structured_json=ai_structured_json,
+        payload=payload,
     )
 
 
-def extract_resume_education_text(*, structured_json: str | None, ai_structured_json: str | None = None) -> str:
+def extract_resume_education_text(
+    *,
+    structured_json: str | None,
+    ai_structured_json: str | None = None,
+    payload: dict[str, Any] | None = None,
+) -> str:
     """
     Extract a best-effort education text blob from resume payloads.
 
     Args:
         structured_json: Deterministic structured resume JSON.
         ai_structured_json: AI-structured resume JSON fallback.
+        payload: Already-parsed resume payload; skips JSON decoding when given.
 
     Returns:
         A single combined education text string.
@@ -284,6 +347,7 @@ def extract_resume_education_text(*, structured_json: str | None, ai_structured_
         section_name="education",
         structured_json=structured_json,
         ai_structured_json=ai_structured_json,
+        payload=payload,
     )
 
 
@@ -304,23 +368,15 @@ def experience_relevance_score(*, job_tokens: list[str], experience_text: str) -
     Error Handling:
         Returns 0.0 when either input is too weak to score.
     """
-    et = (experience_text or "").lower().strip()
+    et = (experience_text or "").strip()
     if not et or not job_tokens:
         return 0.0
 
-    exp_tokens: set[str] = set()
-    for m in _WORD_RE.finditer(et):
-        w = m.group(0).strip(".")
-        if not w or w in _STOP:
-            continue
-        exp_tokens.add(w)
-        if len(exp_tokens) >= 800:
-            break
-
-    if not exp_tokens:
+    matched, has_tokens = _matched_job_tokens(et, job_tokens, 800)
+    if not has_tokens:
         return 0.0
 
-    overlap = sum(1 for t in job_tokens if t in exp_tokens)
+    overlap = sum(1 for t in job_tokens if t in matched)
     overlap_ratio = overlap / max(1, len(job_tokens))
     length_factor = min(1.0, max(0.0, len(et) / 900.0))
     score = 0.7 * overlap_ratio + 0.3 * length_factor
@@ -344,23 +400,15 @@ def projects_relevance_score(*, job_tokens: list[str], projects_text: str) -> fl
     Error Handling:
         Returns 0.0 when either input is too weak to score.
     """
-    pt = (projects_text or "").lower().strip()
+    pt = (projects_text or "").strip()
     if not pt or not job_tokens:
         return 0.0
 
-    project_tokens: set[str] = set()
-    for m in _WORD_RE.finditer(pt):
-        w = m.group(0).strip(".")
-        if not w or w in _STOP:
-            continue
-        project_tokens.add(w)
-        if len(project_tokens) >= 700:
-            break
-
-    if not project_tokens:
+    matched, has_tokens = _matched_job_tokens(pt, job_tokens, 700)
+    if not has_tokens:
         return 0.0
 
-    overlap = sum(1 for t in job_tokens if t in project_tokens)
+    overlap = sum(1 for t in job_tokens if t in matched)
     overlap_ratio = overlap / max(1, len(job_tokens))
     length_factor = min(1.0, max(0.0, len(pt) / 700.0))
     score = 0.75 * overlap_ratio + 0.25 * length_factor
@@ -389,21 +437,13 @@ def education_relevance_score(*, job_title: str | None, job_description: str | N
     if not txt:
         return 0.0
 
-    degree_hits = 0
-    for kw in ("b.tech", "btech", "b.e", "be ", "bachelor", "m.tech", "mtech", "master", "computer science", "engineering"):
-        if kw in txt:
-            degree_hits += 1
-
-    cert_hits = 0
-    for kw in ("certification", "certified", "course", "bootcamp", "specialization"):
-        if kw in txt:
-            cert_hits += 1
+    # Plain substring checks over these short keyword tuples measure several
+    # times faster than an equivalent overlapping-match regex alternation.
+    degree_hits = sum(1 for kw in _DEGREE_KEYWORDS if kw in txt)
+    cert_hits = sum(1 for kw in _CERT_KEYWORDS if kw in txt)
 
     job_text = f"{job_title or ''} {job_description or ''}".lower()
-    stem_overlap = 0
-    for stem in ("backend", "api", "cloud", "data", "python", "java", "javascript", "sql", "devops"):
-        if stem in txt and stem in job_text:
-            stem_overlap += 1
+    stem_overlap = sum(1 for stem in _STEM_KEYWORDS if stem in txt and stem in job_text)
 
     score = 0.35 * min(1.0, degree_hits / 3.0) + 0.15 * min(1.0, cert_hits / 2.0) + 0.50 * min(1.0, stem_overlap / 4.0)
     return float(max(0.0, min(1.0, score)))
@@ -434,19 +474,13 @@ def compute_final_score(
     Error Handling:
         Clamps each incoming component into [0, 1] before aggregation.
     """
-    semantic_score = max(0.0, min(1.0, float(semantic_score or 0.0)))
-    skills_score = max(0.0, min(1.0, float(skills_score or 0.0)))
-    experience_score = max(0.0, min(1.0, float(experience_score or 0.0)))
-    ai_evaluation_score = max(0.0, min(1.0, float(ai_evaluation_score or 0.0)))
-
     val = 100.0 * (
-        SCORING_WEIGHTS["skills"] * skills_score
-        + SCORING_WEIGHTS["experience"] * experience_score
-        + SCORING_WEIGHTS["semantic"] * semantic_score
-        + SCORING_WEIGHTS["ai"] * ai_evaluation_score
+        SCORING_WEIGHTS["skills"] * _unit_score(skills_score)
+        + SCORING_WEIGHTS["experience"] * _unit_score(experience_score)
+        + SCORING_WEIGHTS["semantic"] * _unit_score(semantic_score)
+        + SCORING_WEIGHTS["ai"] * _unit_score(ai_evaluation_score)
     )
-    out = int(round(val))
-    return max(0, min(100, out))
+    return max(0, min(100, int(round(val))))
 
 
 def score_application(
@@ -485,37 +519,40 @@ def score_application(
         Produces a valid breakdown even when some resume or AI signals are
         missing.
     """
-    resume_skills = extract_resume_skills(
-        structured_json=resume_structured_json,
-        ai_structured_json=resume_ai_structured_json,
-    )
     job_skills = extract_job_skill_tokens(
         job_title=job_title,
         job_description=job_description,
         required_skills=job_required_skills,
     )
+    # Decode the resume payload once and share it across every section extractor.
+    payload = _load_resume_payload(resume_structured_json, resume_ai_structured_json)
+    # Without required skills the overlap score is 0, so skip resume skill extraction.
+    resume_skills = extract_resume_skills(
+        structured_json=resume_structured_json,
+        ai_structured_json=resume_ai_structured_json,
+        payload=payload,
+    ) if job_skills else []
     skills_score, matched, missing = skills_overlap_score(resume_skills=resume_skills, job_skills=job_skills)
 
     exp_text = extract_resume_experience_text(
         structured_json=resume_structured_json,
         ai_structured_json=resume_ai_structured_json,
+        payload=payload,
     )
-    context_tokens = [
-        token
-        for token in _context_tokens(f"{job_title or ''} {job_description or ''}")
-        if token not in _STOP
-    ][:80]
+    context_tokens = _context_tokens(f"{job_title or ''} {job_description or ''}")[:80]
     raw_experience_relevance = experience_relevance_score(job_tokens=context_tokens, experience_text=exp_text)
 
     projects_text = extract_resume_projects_text(
         structured_json=resume_structured_json,
         ai_structured_json=resume_ai_structured_json,
+        payload=payload,
     )
     projects_score = projects_relevance_score(job_tokens=context_tokens, projects_text=projects_text)
 
     edu_text = extract_resume_education_text(
         structured_json=resume_structured_json,
         ai_structured_json=resume_ai_structured_json,
+        payload=payload,
     )
     education_score = education_relevance_score(
         job_title=job_title,
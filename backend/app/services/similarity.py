@@ -6,9 +6,12 @@ This module is responsible for:
 """
 
 import math
+from collections.abc import Sequence
 
+import numpy as np
 
-def cosine_similarity(a: list[float], b: list[float]) -> float:
+
+def cosine_similarity(a: Sequence[float] | np.ndarray, b: Sequence[float] | np.ndarray) -> float:
     """
     Compute cosine similarity between two vectors.
 
@@ -26,17 +29,16 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     Error Handling:
         Returns 0.0 when vectors are empty, misaligned, or degenerate.
     """
-    if not a or not b:
+    if a is None or b is None:
         return 0.0
-    if len(a) != len(b):
+    va = np.asarray(a, dtype=np.float64)
+    vb = np.asarray(b, dtype=np.float64)
+    if va.ndim != 1 or vb.ndim != 1 or va.size == 0 or va.size != vb.size:
         return 0.0
-    dot = 0.0
-    na = 0.0
-    nb = 0.0
-    for x, y in zip(a, b):
-        dot += x * y
-        na += x * x
-        nb += y * y
-    if na <= 0.0 or nb <= 0.0:
+    na = float(va @ va)
+    nb = float(vb @ vb)
+    if not (na > 0.0 and nb > 0.0):
         return 0.0
-    return float(dot / (math.sqrt(na) * math.sqrt(nb)))
+    score = float(va @ vb) / math.sqrt(na * nb)
+    # NaN/inf components would otherwise reach scoring, where clamping turns NaN into full credit.
+    return score if math.isfinite(score) else 0.0
@@ -2,6 +2,7 @@
 Centralized error handling and user-friendly error messages.
 """
 import logging
+import re
 from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
@@ -15,38 +16,47 @@ ERROR_MESSAGES = {
     "validation_error": "Please check your input and try again.",
 }
 
+# Bound once so the fallback and hot error paths skip the dict lookup.
+SERVER_ERROR_MESSAGE = ERROR_MESSAGES["server_error"]
+DATABASE_ERROR_MESSAGE = ERROR_MESSAGES["database_error"]
+
+# One pass over the lowercased DB error text; the named group that matched is the error kind.
+_DB_ERROR_RE = re.compile(
+    r"(?P<conflict>duplicate|unique)|(?P<reference>foreign key)|(?P<unavailable>connection|operational)"
+)
+
 
 def get_error_message(error_key: str, default: str | None = None) -> str:
     """Get a user-friendly error message."""
-    return ERROR_MESSAGES.get(error_key, default or ERROR_MESSAGES["server_error"])
+    return ERROR_MESSAGES.get(error_key, default or SERVER_ERROR_MESSAGE)
 
 
 def handle_database_error(error: Exception, operation: str = "") -> HTTPException:
     """Handle database errors with user-friendly messages."""
-    logger.error(f"Database error during {operation}: {error}")
+    logger.error("Database error during %s: %s", operation, error)
     
-    error_str = str(error).lower()
+    kinds = {m.lastgroup for m in _DB_ERROR_RE.finditer(str(error).lower())}
     
-    # Detect specific DB errors
-    if "duplicate" in error_str or "unique" in error_str:
+    # Detect specific DB errors (checked in priority order)
+    if "conflict" in kinds:
         return HTTPException(
             status_code=409,
             detail="This record already exists. Please check your input."
         )
     
-    if "foreign key" in error_str:
+    if "reference" in kinds:
         return HTTPException(
             status_code=400,
             detail="Invalid reference. The related record may have been deleted."
         )
     
-    if "connection" in error_str or "operational" in error_str:
+    if "unavailable" in kinds:
         return HTTPException(
             status_code=503,
-            detail=get_error_message("database_error")
+            detail=DATABASE_ERROR_MESSAGE
         )
     
     return HTTPException(
         status_code=500,
-        detail=get_error_message("server_error")
+        detail=SERVER_ERROR_MESSAGE
     )
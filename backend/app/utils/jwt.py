@@ -1,5 +1,7 @@
-from datetime import datetime, timedelta
-from jose import jwt
+import base64
+import hmac
+import json
+import time
 
 from ..config import SECRET_KEY
 
@@ -7,10 +9,29 @@ ALGORITHM = "HS256"
 # Dev-friendly default (prevents users getting randomly logged out during testing).
 # If you want shorter sessions later, reduce this and add refresh tokens.
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
+_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# base64url('{"alg":"HS256","typ":"JWT"}'), the same header python-jose emits.
+_HEADER_B64 = b"eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
+_SECRET_BYTES = SECRET_KEY.encode("utf-8")
+
+
+def _b64url(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
 
 
 def create_access_token(data: dict) -> str:
+    """
+    Mint an HS256 JWT directly with hmac/hashlib.
+
+    Tokens are byte-compatible with `jose.jwt.encode`, so `jose.jwt.decode`
+    in `dependencies.py` verifies them unchanged.
+    """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode["exp"] = int(time.time()) + _EXPIRE_SECONDS
+    body = _b64url(json.dumps(to_encode, separators=(",", ":")).encode("utf-8"))
+    signing_input = _HEADER_B64 + b"." + body
+    # One-shot hmac.digest with a digest name runs entirely in OpenSSL
+    # (SHA-NI where the CPU has it) without building an HMAC object.
+    signature = _b64url(hmac.digest(_SECRET_BYTES, signing_input, "sha256"))
+    return (signing_input + b"." + signature).decode("ascii")
@@ -3,9 +3,11 @@ from .dependencies import get_current_user
 
 
 def _role_required(required_role: str):
+    denied_detail = f"{required_role.capitalize()} access only"
+
     def check_role(user=Depends(get_current_user)):
-        if user.get("role") != required_role:
-            raise HTTPException(status_code=403, detail=f"{required_role.capitalize()} access only")
+        if user["role"] != required_role:
+            raise HTTPException(status_code=403, detail=denied_detail)
         return user
     return check_role
 
@@ -1,5 +1,32 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
 import bcrypt
 
+from ..config import AUTH_VERIFY_CACHE, AUTH_VERIFY_CACHE_TTL_S, BCRYPT_ROUNDS, SECRET_KEY
+
+
+# Keyed digests of recently verified (password, hash) pairs -> expiry (monotonic).
+# Only successful checks are stored, so a miss always pays the full bcrypt cost.
+_VERIFIED: "OrderedDict[bytes, float]" = OrderedDict()
+_VERIFIED_MAX = 512
+# login runs in the threadpool; every read/write of _VERIFIED happens under this lock.
+_VERIFIED_LOCK = threading.Lock()
+_VERIFY_KEY = hashlib.sha256(SECRET_KEY.encode("utf-8")).digest()
+
+
+def _password_bytes(password: str) -> bytes | None:
+    """Encode a password for bcrypt, or return None if it exceeds 72 bytes."""
+    if password.isascii():
+        # ASCII: char count == byte count, so reject before encoding.
+        if len(password) > 72:
+            return None
+        return password.encode("ascii")
+    pw_bytes = password.encode("utf-8")
+    return pw_bytes if len(pw_bytes) <= 72 else None
+
 
 def hash_password(password: str) -> str:
     """
@@ -11,21 +38,58 @@ def hash_password(password: str) -> str:
     if not password:
         raise ValueError("Password is required")
 
-    pw_bytes = password.encode("utf-8")
-    if len(pw_bytes) > 72:
+    pw_bytes = _password_bytes(password)
+    if pw_bytes is None:
         raise ValueError("Password must be 72 bytes or less")
 
-    hashed = bcrypt.hashpw(pw_bytes, bcrypt.gensalt())
+    hashed = bcrypt.hashpw(pw_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
     return hashed.decode("utf-8")
 
 
+def _verify_cache_key(pw_bytes: bytes, hashed_bytes: bytes) -> bytes:
+    return hashlib.blake2b(pw_bytes + b"|" + hashed_bytes, key=_VERIFY_KEY, digest_size=16).digest()
+
+
+def _recently_verified(key: bytes, now: float) -> bool:
+    with _VERIFIED_LOCK:
+        expires_at = _VERIFIED.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= now:
+            del _VERIFIED[key]
+            return False
+        _VERIFIED.move_to_end(key)
+        return True
+
+
+def _remember_verified(key: bytes, expires_at: float) -> None:
+    with _VERIFIED_LOCK:
+        _VERIFIED[key] = expires_at
+        _VERIFIED.move_to_end(key)
+        while len(_VERIFIED) > _VERIFIED_MAX:
+            _VERIFIED.popitem(last=False)
+
+
 def verify_password(password: str, hashed: str) -> bool:
     try:
         if not password or not hashed:
             return False
-        pw_bytes = password.encode("utf-8")
-        if len(pw_bytes) > 72:
+        pw_bytes = _password_bytes(password)
+        if pw_bytes is None:
+            return False
+        hashed_bytes = hashed.encode("utf-8")
+        if not AUTH_VERIFY_CACHE:
+            return bcrypt.checkpw(pw_bytes, hashed_bytes)
+
+        key = _verify_cache_key(pw_bytes, hashed_bytes)
+        now = time.monotonic()
+        if _recently_verified(key, now):
+            return True
+
+        # bcrypt runs outside the lock so concurrent logins are not serialized.
+        if not bcrypt.checkpw(pw_bytes, hashed_bytes):
             return False
-        return bcrypt.checkpw(pw_bytes, hashed.encode("utf-8"))
+        _remember_verified(key, now + AUTH_VERIFY_CACHE_TTL_S)
+        return True
     except Exception:
         return False
@@ -2,10 +2,38 @@
 Validation utilities for input validation and error handling.
 """
 import re
+from functools import lru_cache
 from typing import Any
 from fastapi import HTTPException
 
 
+# Basic email regex, compiled once at import.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+_VALID_ROLES = frozenset({"admin", "recruiter", "candidate"})
+_VALID_JOB_STATUSES = frozenset({"active", "draft", "closed", "deleted"})
+_INVALID_ROLE_MSG = "Invalid role. Must be one of: " + ", ".join(sorted(_VALID_ROLES))
+_INVALID_JOB_STATUS_MSG = "Invalid status. Must be one of: " + ", ".join(sorted(_VALID_JOB_STATUSES))
+
+
+@lru_cache(maxsize=64)
+def _compile(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+# Field names and limits come from a small fixed set of call sites, so the
+# assembled failure messages are cached rather than re-formatted each time.
+@lru_cache(maxsize=256)
+def _min_length_message(field_name: str, min_length: int) -> str:
+    return f"{field_name} must be at least {min_length} characters"
+
+
+@lru_cache(maxsize=256)
+def _max_length_message(field_name: str, max_length: int) -> str:
+    return f"{field_name} must not exceed {max_length} characters"
+
+
 def validate_email(email: str) -> str:
     """Validate email format."""
     if not email or not isinstance(email, str):
@@ -15,9 +43,7 @@ def validate_email(email: str) -> str:
     if len(email) > 255:
         raise HTTPException(status_code=400, detail="Email too long (max 255 characters)")
     
-    # Basic email regex
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if not _EMAIL_RE.match(email):
         raise HTTPException(status_code=400, detail="Invalid email format")
     
     return email
@@ -41,7 +67,7 @@ def validate_string_field(
     min_length: int = 1,
     max_length: int = 1000,
     required: bool = True,
-    pattern: str | None = None,
+    pattern: str | re.Pattern | None = None,
 ) -> str | None:
     """Validate a string field with common rules."""
     if value is None:
@@ -58,18 +84,14 @@ def validate_string_field(
         raise HTTPException(status_code=400, detail=f"{field_name} cannot be empty")
     
     if len(value) < min_length:
-        raise HTTPException(
-            status_code=400,
-            detail=f"{field_name} must be at least {min_length} characters"
-        )
+        raise HTTPException(status_code=400, detail=_min_length_message(field_name, min_length))
     
     if len(value) > max_length:
-        raise HTTPException(
-            status_code=400,
-            detail=f"{field_name} must not exceed {max_length} characters"
-        )
+        raise HTTPException(status_code=400, detail=_max_length_message(field_name, max_length))
     
-    if pattern and not re.match(pattern, value):
+    if isinstance(pattern, str):
+        pattern = _compile(pattern) if pattern else None
+    if pattern is not None and not pattern.match(value):
         raise HTTPException(status_code=400, detail=f"{field_name} format is invalid")
     
     return value
@@ -89,10 +111,15 @@ def validate_integer_field(
         return None
     
     if not isinstance(value, int):
-        try:
-            value = int(value)
-        except (ValueError, TypeError):
-            raise HTTPException(status_code=400, detail=f"{field_name} must be a valid integer")
+        digits = value.strip() if isinstance(value, str) else None
+        if digits and digits.removeprefix("-").isdecimal():
+            # Plain numeric strings (query/path params) convert without the exception path.
+            value = int(digits)
+        else:
+            try:
+                value = int(value)
+            except (ValueError, TypeError):
+                raise HTTPException(status_code=400, detail=f"{field_name} must be a valid integer")
     
     if min_value is not None and value < min_value:
         raise HTTPException(
@@ -114,14 +141,14 @@ def validate_role(role: str) -> str:
     if not role or not isinstance(role, str):
         raise HTTPException(status_code=400, detail="Role is required")
     
+    # Callers almost always send an already-normalized value: one set probe.
+    if role in _VALID_ROLES:
+        return role
+    
     role = role.strip().lower()
-    valid_roles = {"admin", "recruiter", "candidate"}
     
-    if role not in valid_roles:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid role. Must be one of: {', '.join(valid_roles)}"
-        )
+    if role not in _VALID_ROLES:
+        raise HTTPException(status_code=400, detail=_INVALID_ROLE_MSG)
     
     return role
 
@@ -131,13 +158,12 @@ def validate_job_status(status: str | None) -> str:
     if not status:
         return "active"
     
+    if status in _VALID_JOB_STATUSES:
+        return status
+    
     status = status.strip().lower()
-    valid_statuses = {"active", "draft", "closed", "deleted"}
     
-    if status not in valid_statuses:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-        )
+    if status not in _VALID_JOB_STATUSES:
+        raise HTTPException(status_code=400, detail=_INVALID_JOB_STATUS_MSG)
     
     return status
@@ -1,14 +1,33 @@
+import time
 import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+import bcrypt
 
 from fastapi import HTTPException
+from jose import jwt as jose_jwt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from app.config import SECRET_KEY
+from app.models.analysis_task import AnalysisTask
 from app.modules.applications.status import (
     DEFAULT_APPLICATION_STATUS,
     normalize_application_status,
     validate_application_status,
 )
+from app.services.ai_client import _pick_best_model
+from app.services.embedding_service import encode_vector, vector_from_row
+from app.services import progress_tracker
 from app.services.job_service import _validate_range_pair
 from app.services.scoring_service import compute_final_score, score_application
+from app.services.similarity import cosine_similarity
+from app.utils import security
+from app.utils.error_handlers import DATABASE_ERROR_MESSAGE, SERVER_ERROR_MESSAGE, handle_database_error
+from app.utils.jwt import ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, create_access_token
 
 
 class ApplicationStatusTests(unittest.TestCase):
@@ -48,6 +67,23 @@ class ScoringContractTests(unittest.TestCase):
         ))
 
 
+class CosineSimilarityTests(unittest.TestCase):
+    def test_parallel_and_orthogonal_vectors(self):
+        self.assertAlmostEqual(cosine_similarity([1.0, 2.0], [2.0, 4.0]), 1.0)
+        self.assertEqual(cosine_similarity([1.0, 0.0], [0.0, 1.0]), 0.0)
+
+    def test_invalid_inputs_score_zero(self):
+        self.assertEqual(cosine_similarity(None, None), 0.0)
+        self.assertEqual(cosine_similarity([], []), 0.0)
+        self.assertEqual(cosine_similarity([1.0, 2.0], [1.0]), 0.0)
+        self.assertEqual(cosine_similarity([[1.0, 2.0]], [1.0, 2.0]), 0.0)
+        self.assertEqual(cosine_similarity([0.0, 0.0], [1.0, 2.0]), 0.0)
+
+    def test_non_finite_components_score_zero(self):
+        self.assertEqual(cosine_similarity([float("nan"), 1.0], [1.0, 1.0]), 0.0)
+        self.assertEqual(cosine_similarity([float("inf"), 1.0], [1.0, 1.0]), 0.0)
+
+
 class JobValidationTests(unittest.TestCase):
     def test_range_pair_rejects_inverted_values(self):
         with self.assertRaises(HTTPException):
@@ -58,5 +94,144 @@ class JobValidationTests(unittest.TestCase):
         self.assertIsNone(_validate_range_pair(None, 20, "Salary"))
 
 
+class EmbeddingStorageTests(unittest.TestCase):
+    def test_compact_vector_round_trips(self):
+        vector = [0.5, -1.25, 3.0, 0.0]
+        payload = encode_vector(vector)
+        self.assertTrue(payload.startswith("f32:"))
+        self.assertEqual(vector_from_row(SimpleNamespace(vector_json=payload)), vector)
+
+    def test_legacy_json_rows_still_decode(self):
+        row = SimpleNamespace(vector_json="[0.5, -1.25, 3]")
+        self.assertEqual(vector_from_row(row), [0.5, -1.25, 3.0])
+
+    def test_missing_or_unreadable_payloads_decode_empty(self):
+        self.assertEqual(vector_from_row(None), [])
+        self.assertEqual(vector_from_row(SimpleNamespace(vector_json="not json")), [])
+        self.assertEqual(vector_from_row(SimpleNamespace(vector_json='{"a": 1}')), [])
+
+
+class AccessTokenTests(unittest.TestCase):
+    def test_minted_token_decodes_with_jose(self):
+        before = int(time.time())
+        token = create_access_token({"sub": "42", "role": "candidate", "name": "Zoë Müller"})
+        payload = jose_jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+        self.assertEqual(payload["sub"], "42")
+        self.assertEqual(payload["role"], "candidate")
+        self.assertEqual(payload["name"], "Zoë Müller")
+        self.assertIsInstance(payload["exp"], int)
+        lifetime = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        self.assertGreaterEqual(payload["exp"], before + lifetime)
+        self.assertLessEqual(payload["exp"], int(time.time()) + lifetime)
+        self.assertEqual(lifetime, 7 * 24 * 60 * 60)
+
+
+class PasswordVerifyCacheTests(unittest.TestCase):
+    def setUp(self):
+        security._VERIFIED.clear()
+        self.hashed = bcrypt.hashpw(b"s3cret-pass", bcrypt.gensalt(rounds=4)).decode("utf-8")
+        self.addCleanup(security._VERIFIED.clear)
+
+    def test_repeat_success_is_served_from_cache(self):
+        with mock.patch.object(security, "AUTH_VERIFY_CACHE", True), \
+                mock.patch.object(security.bcrypt, "checkpw", wraps=bcrypt.checkpw) as checkpw:
+            self.assertTrue(security.verify_password("s3cret-pass", self.hashed))
+            self.assertTrue(security.verify_password("s3cret-pass", self.hashed))
+        self.assertEqual(checkpw.call_count, 1)
+
+    def test_wrong_password_is_never_cached(self):
+        with mock.patch.object(security, "AUTH_VERIFY_CACHE", True), \
+                mock.patch.object(security.bcrypt, "checkpw", wraps=bcrypt.checkpw) as checkpw:
+            self.assertFalse(security.verify_password("wrong-pass", self.hashed))
+            self.assertFalse(security.verify_password("wrong-pass", self.hashed))
+        self.assertEqual(checkpw.call_count, 2)
+        self.assertEqual(len(security._VERIFIED), 0)
+
+
+class DatabaseErrorHandlerTests(unittest.TestCase):
+    def test_each_error_kind_maps_to_its_status(self):
+        cases = [
+            ("Duplicate entry 'a@b.c' for key 'users.email'", 409),
+            ("UNIQUE constraint failed", 409),
+            ("Cannot add or update a child row: a FOREIGN KEY constraint fails", 400),
+            ("Lost connection to MySQL server", 503),
+            ("(pymysql.err.OperationalError) server has gone away", 503),
+            ("something else entirely", 500),
+        ]
+        for text, status in cases:
+            with self.subTest(text=text):
+                self.assertEqual(handle_database_error(Exception(text)).status_code, status)
+
+    def test_conflict_wins_over_unavailable(self):
+        exc = handle_database_error(Exception("OperationalError: Duplicate entry"))
+        self.assertEqual(exc.status_code, 409)
+
+    def test_fixed_messages_are_used_for_unavailable_and_unknown(self):
+        self.assertEqual(handle_database_error(Exception("connection refused")).detail, DATABASE_ERROR_MESSAGE)
+        self.assertEqual(handle_database_error(Exception("boom")).detail, SERVER_ERROR_MESSAGE)
+
+    def test_non_ascii_case_variants_do_not_raise(self):
+        for text in ("unıque constraint", "FOREİGN KEY constraint"):
+            with self.subTest(text=text):
+                self.assertEqual(handle_database_error(Exception(text)).status_code, 500)
+
+
+class ExpiredTaskPurgeTests(unittest.TestCase):
+    def setUp(self):
+        # Only the analysis_tasks table is needed; an in-memory engine keeps this off MySQL.
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        AnalysisTask.__table__.create(engine)
+        self.addCleanup(engine.dispose)
+        session_factory = sessionmaker(bind=engine)
+        patcher = mock.patch.object(progress_tracker, "SessionLocal", session_factory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.session_factory = session_factory
+
+    def _add_task(self, task_id, *, status, expires_in_hours):
+        with self.session_factory() as db:
+            db.add(AnalysisTask(
+                id=task_id,
+                user_id=1,
+                job_id=1,
+                status=status,
+                expires_at=datetime.utcnow() + timedelta(hours=expires_in_hours),
+            ))
+            db.commit()
+
+    def test_removes_only_expired_finished_tasks(self):
+        self._add_task("expired-done", status="done", expires_in_hours=-1)
+        self._add_task("expired-error", status="error", expires_in_hours=-1)
+        self._add_task("expired-running", status="running", expires_in_hours=-1)
+        self._add_task("fresh-done", status="done", expires_in_hours=1)
+
+        self.assertEqual(progress_tracker.purge_expired_tasks(), 2)
+        with self.session_factory() as db:
+            remaining = {row.id for row in db.query(AnalysisTask)}
+        self.assertEqual(remaining, {"expired-running", "fresh-done"})
+
+
+class ModelDiscoveryTests(unittest.TestCase):
+    def test_live_and_batch_only_models_are_not_generate_candidates(self):
+        models = [
+            {"name": "models/gemini-live-flash", "supportedGenerationMethods": ["bidiGenerateContent"]},
+            {"name": "models/gemini-batch-flash", "supportedGenerationMethods": ["batchGenerateContent"]},
+        ]
+        self.assertIsNone(_pick_best_model(models))
+
+    def test_generate_content_methods_match_exactly(self):
+        models = [
+            {"name": "models/gemini-live-flash", "supportedGenerationMethods": ["bidiGenerateContent"]},
+            {"name": "models/gemini-pro", "supportedGenerationMethods": ["generateContent"]},
+            {"name": "models/gemini-stream", "supported_generation_methods": ["methods/streamGenerateContent"]},
+        ]
+        self.assertEqual(_pick_best_model(models), "models/gemini-stream")
+        self.assertEqual(_pick_best_model(models[:2]), "models/gemini-pro")
+
+    def test_models_without_listed_methods_are_assumed_compatible(self):
+        self.assertEqual(_pick_best_model([{"name": "models/gemini-flash"}]), "models/gemini-flash")
+
+
 if __name__ == "__main__":
     unittest.main()